@@ -17,20 +17,62 @@
 # - THEME ICON: iconPath is REQUIRED; Theme tab has relative path + PNG picker.
 #   Build copies PNG to Textures/<iconPath>.png. Import resolves existing icon.
 
-import re, shutil, webbrowser, os, json, subprocess, sys, math
+import functools, io, re, os, json, queue, subprocess, sys, threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-import xml.etree.ElementTree as ET
+try:
+	from lxml import etree as ET  # C-backed parse, same ElementTree API
+	_HAVE_LXML = True
+except ImportError:
+	import xml.etree.ElementTree as ET
+	_HAVE_LXML = False
+try:
+	import orjson  # optional: C-backed .mefproj load/save
+except ImportError:
+	orjson = None
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox, simpledialog
+from tkinter import ttk, filedialog, messagebox
 
 APP_TITLE = "MEF Builder v3.2.0"
 
-BATTLE_CUES = {"BattleSmall","BattleMedium","BattleLarge","BattleLegendary"}
+BATTLE_CUES = frozenset(map(sys.intern, ("BattleSmall","BattleMedium","BattleLarge","BattleLegendary")))
+_MC_CUES = frozenset(map(sys.intern, ("MainMenu","Credits")))
+# cue type -> preflight category (ambient / main-credits / battle / custom)
+_CUE_CAT = {None: "a", "MainMenu": "m", "Credits": "m", "Custom": "cu"}
+for _c in BATTLE_CUES: _CUE_CAT[_c] = "b"
+del _c
+_STEAM_RULES = (
+	"\nSTEAM WORKSHOP CONTENT & COMMUNITY RULES (brief)\n"
+	"• Only upload content you own or have permission to use.\n"
+	"• No malware, scams, or illegal content; respect local laws.\n"
+	"• No harassment/hate speech; follow DMCA takedowns.\n"
+	"• Provide accurate descriptions/tags; avoid spam.\n"
+)
 DEFAULT_BIOMES = [
 	"TemperateForest","BorealForest","Tundra","AridShrubland","Desert",
 	"TropicalRainforest","TemperateSwamp","TropicalSwamp","IceSheet","SeaIce"
 ]
 INVALID_FS = r'<>:"/\\|?*'
+_SANITIZE_TABLE = str.maketrans({c: "_" for c in INVALID_FS})
+
+# Hot-path regexes, compiled once at import
+_RE_OGG         = re.compile(r'\.ogg$', re.IGNORECASE)
+_RE_WS          = re.compile(r'\s+')
+_RE_NONALNUM    = re.compile(r'[^A-Za-z0-9]')
+_RE_TOKS        = re.compile(r'[A-Za-z0-9]+')
+_RE_LABEL_SPLIT = re.compile(r'\s+[-–—]\s+')
+_RE_CLIP        = re.compile(r'^\s*MusicExpanded/([^/]+)/(\d{3})\.\s*(.+?)\s*$')
+_RE_ME_DEF      = re.compile(r'^\s*ME_([A-Z0-9]+)\s*$')
+_RE_ME_LABEL    = re.compile(r'^\s*Music Expanded:\s*')
+
+@functools.lru_cache(maxsize=64)
+def _title_prefix_re(game_label: str, content_folder: str):
+	# strips the optional leading track number and the optional game/OST
+	# prefix in a single anchored pass
+	return re.compile(r'^\s*(?:\d{1,3}\s*[\.\-]\s*)?'
+		r'(?:(?:' + re.escape(game_label) + r'|' + re.escape(content_folder) + r'|soundtrack|ost)\s*[-–—]\s*)?',
+		re.IGNORECASE)
 
 # ---- Dark / Light palettes
 PAL_D = dict(bg="#1e1e1e", fg="#e6e6e6", alt="#252526", acc="#007acc", mid="#3c3c3c", sel="#094771", trough="#2a2a2a")
@@ -44,226 +86,398 @@ def apply_palette(root: tk.Tk, dark: bool):
 	root.configure(bg=p["bg"])
 	root._palette = p
 
-	style.configure(".", background=p["bg"], foreground=p["fg"], fieldbackground=p["alt"], bordercolor=p["mid"], focuscolor=p["acc"])
-	for n in ("TFrame","TLabelframe","TLabelframe.Label","TLabel","TButton","TEntry","TCheckbutton","TNotebook",
-	          "TNotebook.Tab","TCombobox","TSeparator","TPanedwindow"):
-		style.configure(n, background=p["bg"], foreground=p["fg"])
-	style.configure("TNotebook", background=p["bg"], bordercolor=p["mid"])
-	style.configure("TNotebook.Tab", background=p["alt"], lightcolor=p["alt"], bordercolor=p["mid"], padding=(10,5))
-	style.map("TNotebook.Tab", background=[("selected", p["mid"])], foreground=[("selected", p["fg"])])
-
-	style.configure("Treeview", background=p["alt"], fieldbackground=p["alt"], foreground=p["fg"], bordercolor=p["mid"])
-	style.configure("Treeview.Heading", background=p["mid"], foreground=p["fg"])
-	style.map("Treeview", background=[("selected", p["sel"])])
-
+	# one theme_settings call instead of a style.configure per widget class
+	base = {"configure": {"background": p["bg"], "foreground": p["fg"]}}
+	settings = {
+		".": {"configure": dict(background=p["bg"], foreground=p["fg"], fieldbackground=p["alt"], bordercolor=p["mid"], focuscolor=p["acc"])},
+		"TNotebook": {"configure": dict(background=p["bg"], foreground=p["fg"], bordercolor=p["mid"])},
+		"TNotebook.Tab": {
+			"configure": dict(background=p["alt"], foreground=p["fg"], lightcolor=p["alt"], bordercolor=p["mid"], padding=(10,5)),
+			"map": {"background": [("selected", p["mid"])], "foreground": [("selected", p["fg"])]},
+		},
+		"Treeview": {
+			"configure": dict(background=p["alt"], fieldbackground=p["alt"], foreground=p["fg"], bordercolor=p["mid"]),
+			"map": {"background": [("selected", p["sel"])]},
+		},
+		"Treeview.Heading": {"configure": dict(background=p["mid"], foreground=p["fg"])},
+	}
+	for n in ("TFrame","TLabelframe","TLabelframe.Label","TLabel","TButton","TEntry","TCheckbutton","TCombobox","TSeparator","TPanedwindow"):
+		settings[n] = base
+	scroll = {"configure": dict(background=p["alt"], troughcolor=p["trough"], bordercolor=p["mid"], arrowcolor=p["fg"])}
 	for s in ("Vertical.TScrollbar","Horizontal.TScrollbar","TScrollbar"):
-		style.configure(s, background=p["alt"], troughcolor=p["trough"], bordercolor=p["mid"], arrowcolor=p["fg"])
+		settings[s] = scroll
+	style.theme_settings("clam", settings)
 
-	root.option_add("*Menu*background", p["bg"])
-	root.option_add("*Menu*foreground", p["fg"])
-	root.option_add("*Menu*activeBackground", p["mid"])
-	root.option_add("*Menu*activeForeground", p["fg"])
+	for pattern, key in (("*Menu*background","bg"), ("*Menu*foreground","fg"),
+	                     ("*Menu*activeBackground","mid"), ("*Menu*activeForeground","fg")):
+		root.option_add(pattern, p[key])
 
+# pure string->string helpers, called per track/file: memoized so repeated
+# names (common across defs and re-imports) cost one dict hit
+@functools.lru_cache(maxsize=4096)
 def sanitize_component(s: str) -> str:
-	s2 = "".join("_" if c in INVALID_FS else c for c in s)
-	return s2.rstrip(" .")
+	return s.translate(_SANITIZE_TABLE).rstrip(" .")
 
+@functools.lru_cache(maxsize=4096)
 def sanitize_simple(name: str) -> str:
-	return re.sub(r'[^A-Za-z0-9]', '', name)
+	return _RE_NONALNUM.sub('', name)
+
+def _norm(name: str) -> str:
+	return name.strip().casefold()
 
 def infer_game_code(label: str) -> str:
-	toks = re.findall(r'[A-Za-z0-9]+', label or "")
+	toks = _RE_TOKS.findall(label or "")
 	return ("".join(t[0] for t in toks)[:3] or "GME").upper()
 
+@functools.lru_cache(maxsize=4096)
 def infer_title_from_filename(fname: str, game_label: str, content_folder: str) -> str:
-	title = re.sub(r'\.ogg$', '', fname, flags=re.IGNORECASE)
-	title = re.sub(r'^\s*\d{1,3}\s*[\.\-]\s*', '', title)
-	prefix = r'^\s*(?:' + re.escape(game_label) + r'|' + re.escape(content_folder) + r'|soundtrack|ost)\s*[-–—]\s*'
-	title = re.sub(prefix, '', title, flags=re.IGNORECASE)
-	title = re.sub(r'\s+', ' ', title)
-	return title.strip()
+	title = _RE_OGG.sub('', fname)
+	title = _title_prefix_re(game_label, content_folder).sub('', title, count=1)
+	return _RE_WS.sub(' ', title).strip()
+
+def _iter_ogg(root):
+	# scandir-based walk: DirEntry caches the stat, so no extra syscall per file
+	stack = [root]
+	while stack:
+		try:
+			with os.scandir(stack.pop()) as it:
+				for e in it:
+					if e.is_dir(follow_symlinks=False):
+						stack.append(e.path)
+					elif e.name.lower().endswith(".ogg"):
+						yield e.path
+		except OSError:
+			continue
+
+def _fast_copy(src, dst):
+	# kernel-side copy on Linux (copy_file_range: bytes never enter Python);
+	# anywhere else shutil.copyfile already picks the platform fast path
+	# (sendfile/CopyFileEx/fcopyfile)
+	try:
+		with open(src, "rb") as s, open(dst, "wb") as d:
+			fsrc, fdst = s.fileno(), d.fileno()
+			remaining = os.fstat(fsrc).st_size
+			while remaining > 0:
+				n = os.copy_file_range(fsrc, fdst, remaining)
+				if n == 0: break
+				remaining -= n
+	except (AttributeError, OSError):
+		import shutil
+		shutil.copyfile(src, dst)
+
+def _write_if_changed(path: Path, text: str) -> bool:
+	# don't touch disk (or bump mtime) when the bytes already match
+	new = text.encode("utf-8")
+	try:
+		if path.read_bytes() == new: return False
+	except OSError:
+		pass
+	path.write_bytes(new)
+	return True
+
+def _same_file(src, dst) -> bool:
+	# cheap identity check: matching size + mtime means we can skip the copy
+	try:
+		s = os.stat(src); d = os.stat(dst)
+	except OSError:
+		return False
+	return s.st_size == d.st_size and s.st_mtime_ns == d.st_mtime_ns
 
 def dep_for_version(v: str):
 	try: val = float(v)
 	except: val = 99.9
 	return ("musicexpanded.framework", "Music Expanded Framework") if val < 1.5 else ("zal.mef", "Music Expanded Framework")
 
+# precomputed for the versions the tool advertises (1.3 → 2.0); odd custom
+# versions fall back to dep_for_version
+_DEP_TABLE = {v: dep_for_version(v) for v in ("1.3","1.4","1.5","1.6","2.0")}
+
 # ---------------- Data models ----------------
 class TrackUse:
+	__slots__ = ("cue_type", "cue_data", "allowed_biomes", "_summary")
 	def __init__(self, cue_type=None, cue_data="", allowed_biomes=None):
-		self.cue_type = cue_type  # None = Ambient
+		self.cue_type = sys.intern(cue_type) if cue_type else None  # None = Ambient
 		self.cue_data = (cue_data or "").strip()
 		self.allowed_biomes = list(allowed_biomes) if allowed_biomes else []
+		self._summary = None  # uses are replaced, never mutated, so cache once
+	def key(self):
+		# identity for apply/remove matching: cueData only distinguishes Customs
+		return (self.cue_type, self.cue_data if self.cue_type == "Custom" else "")
 	def summary(self):
+		s = self._summary
+		if s is not None: return s
 		tag = "Ambient" if self.cue_type is None else ("Custom" if self.cue_type=="Custom" else self.cue_type)
 		if self.cue_type=="Custom" and self.cue_data: tag += f"[{self.cue_data}]"
 		if self.allowed_biomes: tag += " [" + ",".join(self.allowed_biomes) + "]"
+		self._summary = tag
 		return tag
 
 class Track:
+	__slots__ = ("idx", "path", "display_title", "file_title", "uses", "_lc_cache", "_uses_summary")
 	def __init__(self, idx: int, path: Path, display_title: str, file_title: str):
 		self.idx = idx
 		self.path = Path(path)
 		self.display_title = display_title     # shown in game (right part)
 		self.file_title = file_title           # sanitized for clipPath/filename
 		self.uses: list[TrackUse] = [TrackUse()]  # default Ambient
+		self._lc_cache = None  # (key, label, clip) from the last build
+		self._uses_summary = None  # joined summary column, reset when uses change
+
+	def uses_summary(self) -> str:
+		s = self._uses_summary
+		if s is None:
+			s = self._uses_summary = ", ".join(u.summary() for u in self.uses)
+		return s
+
+	def label_clip(self, label_prefix: str, content_folder: str):
+		# label/clip only change with these inputs, so untouched tracks reuse
+		# the strings composed on the previous preview/build pass
+		key = (label_prefix, content_folder, self.idx, self.file_title, self.display_title)
+		c = self._lc_cache
+		if c is not None and c[0] == key:
+			return c[1], c[2]
+		right = (self.display_title or self.file_title).strip()
+		label = f"{label_prefix} – {right}" if label_prefix else right
+		clip = f"MusicExpanded/{content_folder}/{self.idx:03d}. {self.file_title}"
+		self._lc_cache = (key, label, clip)
+		return label, clip
 
 class ProjectDef:
+	__slots__ = ("label_game", "game_code", "content_folder", "label_prefix",
+	             "theme_description", "tracks", "_next_idx", "_by_idx",
+	             "_src_def_dir", "icon_rel", "icon_src")
 	def __init__(self, label_game: str):
 		self.label_game = label_game
-		self.game_code = infer_game_code(label_game)
-		self.content_folder = sanitize_simple(label_game)
+		self.game_code = sys.intern(infer_game_code(label_game))
+		self.content_folder = sys.intern(sanitize_simple(label_game))
 		self.label_prefix = ""  # OPTIONAL global prefix for labels
 		self.theme_description = f"{label_game} music integrated via the Music Expanded Framework."
 		self.tracks: list[Track] = []
+		self._next_idx = 1  # running max(idx)+1, so bulk adds skip the rescan
+		self._by_idx: dict[int, "Track"]|None = None
 		self._src_def_dir: Path|None = None
 		# REQUIRED Theme icon config
 		self.icon_rel = f'UI/Icons/{self.content_folder or "Game"}'  # relative path (no .png)
 		self.icon_src: Path|None = None  # source PNG (optional, but path is always written)
 
+	def track_by_idx(self, idx: int):
+		# lazily rebuilt lookup; tracks only ever get appended or reassigned
+		m = self._by_idx
+		if m is None or len(m) != len(self.tracks):
+			m = self._by_idx = {t.idx: t for t in self.tracks}
+		return m.get(idx)
+
+	def _fingerprint(self):
+		# cheap hashable summary of everything the XML builders read
+		return (self.label_game, self.game_code, self.content_folder, self.label_prefix,
+		        self.theme_description, self.icon_rel,
+		        tuple((t.idx, t.file_title, t.display_title,
+		               tuple((u.cue_type, u.cue_data, tuple(u.allowed_biomes)) for u in t.uses))
+		              for t in self.tracks))
+
 # ---------------- XML builders ----------------
 def build_about_xml(name, description_cdata, author, package_id, versions_lines, load_after_lines):
 	versions = [ln.strip() for ln in versions_lines if ln.strip()]
 	load_after = [ln.strip() for ln in load_after_lines if ln.strip()]
-	lines = []
-	lines.append('<?xml version="1.0" encoding="utf-8"?>')
-	lines.append('<ModMetaData>')
-	lines.append(f'\t<name>{name}</name>')
-	lines.append('\t<description><![CDATA[' + description_cdata + ']]></description>')
-	lines.append(f'\t<author>{author}</author>')
-	lines.append(f'\t<packageId>{package_id}</packageId>')
-	lines.append('\t\t<supportedVersions>')
+	out = io.StringIO()
+	out.write('<?xml version="1.0" encoding="utf-8"?>\n')
+	out.write('<ModMetaData>\n')
+	out.write(f'\t<name>{name}</name>\n')
+	out.write('\t<description><![CDATA[' + description_cdata + ']]></description>\n')
+	out.write(f'\t<author>{author}</author>\n')
+	out.write(f'\t<packageId>{package_id}</packageId>\n')
+	out.write('\t\t<supportedVersions>\n')
 	for v in versions:
-		lines.append(f'\t\t\t<li>{v}</li>')
-	lines.append('\t\t</supportedVersions>')
-	lines.append('\t<loadAfter>')
+		out.write(f'\t\t\t<li>{v}</li>\n')
+	out.write('\t\t</supportedVersions>\n')
+	out.write('\t<loadAfter>\n')
 	for la in load_after:
-		lines.append(f'\t\t<li>{la}</li>')
-	lines.append('\t</loadAfter>')
-	lines.append('\t\t<modDependenciesByVersion>')
+		out.write(f'\t\t<li>{la}</li>\n')
+	out.write('\t</loadAfter>\n')
+	out.write('\t\t<modDependenciesByVersion>\n')
 	for v in versions:
-		pkg, disp = dep_for_version(v)
-		lines.append(f'\t\t\t<v{v}>')
-		lines.append('\t\t\t\t<li>')
-		lines.append(f'\t\t\t\t\t<packageId>{pkg}</packageId>')
-		lines.append(f'\t\t\t\t\t<displayName>{disp}</displayName>')
-		lines.append('\t\t\t\t\t<downloadUrl>https://github.com/Music-Expanded/music-expanded-framework/releases/latest</downloadUrl>')
-		lines.append('\t\t\t\t</li>')
-		lines.append(f'\t\t\t</v{v}>')
-	lines.append('\t\t</modDependenciesByVersion>')
-	lines.append('</ModMetaData>')
-	return "\n".join(lines) + "\n"
+		pkg, disp = _DEP_TABLE.get(v) or dep_for_version(v)
+		out.write(f'\t\t\t<v{v}>\n')
+		out.write('\t\t\t\t<li>\n')
+		out.write(f'\t\t\t\t\t<packageId>{pkg}</packageId>\n')
+		out.write(f'\t\t\t\t\t<displayName>{disp}</displayName>\n')
+		out.write('\t\t\t\t\t<downloadUrl>https://github.com/Music-Expanded/music-expanded-framework/releases/latest</downloadUrl>\n')
+		out.write('\t\t\t\t</li>\n')
+		out.write(f'\t\t\t</v{v}>\n')
+	out.write('\t\t</modDependenciesByVersion>\n')
+	out.write('</ModMetaData>\n')
+	return out.getvalue()
 
 def _compose_label(prefix: str, right_part: str) -> str:
 	prefix = (prefix or "").strip()
 	right = (right_part or "").strip()
 	return f"{prefix} – {right}" if prefix else right
 
-def xml_trackdef(defname, label, clip_path, cue=None, cue_data=None, allowed_biomes=None) -> str:
-	buf = []
-	buf.append("\t<MusicExpanded.TrackDef>")
-	buf.append(f"\t\t<defName>{defname}</defName>")
-	buf.append(f"\t\t<label>{label}</label>")
-	buf.append(f"\t\t<clipPath>{clip_path}</clipPath>")
-	if cue:
-		buf.append(f"\t\t<cue>{cue}</cue>")
-		if cue == "Custom" and cue_data:
-			buf.append(f"\t\t<cueData>{cue_data}</cueData>")
-	if cue in BATTLE_CUES:
-		buf.append("\t\t<tense>true</tense>")
-	if allowed_biomes:
-		buf.append("\t\t<allowedBiomes>")
-		for b in allowed_biomes:
-			buf.append(f"\t\t\t<li>{b}</li>")
-		buf.append("\t\t</allowedBiomes>")
-	buf.append("\t</MusicExpanded.TrackDef>")
-	return "\n".join(buf)
+# Per-section TrackDef emitters. Each section always emits the same shape, so
+# the cue/cueData/tense branches from the old generic xml_trackdef fall away.
+# The fixed indentation/tag fragments are module constants so the hot lines are
+# plain concatenation instead of per-call f-string formatting.
+_TD_OPEN    = "\t<MusicExpanded.TrackDef>\n\t\t<defName>"
+_TD_LABEL   = "</defName>\n\t\t<label>"
+_TD_CLIP    = "</label>\n\t\t<clipPath>"
+_TD_ENDHEAD = "</clipPath>\n"
+_TD_CUE     = "\t\t<cue>"
+_TD_CUE_END = "</cue>\n"
+_TD_CUSTOM  = "\t\t<cue>Custom</cue>\n"
+_TD_CUEDATA = "\t\t<cueData>"
+_TD_CD_END  = "</cueData>\n"
+_TD_TENSE   = "\t\t<tense>true</tense>\n"
+_TD_CLOSE   = "\t</MusicExpanded.TrackDef>\n"
+
+def _td_head(defname, label, clip_path) -> str:
+	return _TD_OPEN + defname + _TD_LABEL + label + _TD_CLIP + clip_path + _TD_ENDHEAD
+
+_BIOME_FRAG_CACHE: dict[tuple, str] = {}
+
+def _biome_fragment(biomes) -> str:
+	# tracks sharing a biome set reuse the identical rendered block
+	k = tuple(biomes)
+	frag = _BIOME_FRAG_CACHE.get(k)
+	if frag is None:
+		frag = _BIOME_FRAG_CACHE[k] = ("\t\t<allowedBiomes>\n"
+			+ "".join(f"\t\t\t<li>{b}</li>\n" for b in biomes)
+			+ "\t\t</allowedBiomes>\n")
+	return frag
+
+def _emit_ambient(buf, defname, label, clip_path, biomes):
+	buf.write(_td_head(defname, label, clip_path))
+	if biomes: buf.write(_biome_fragment(biomes))
+	buf.write(_TD_CLOSE)
+
+def _emit_maincredits(buf, defname, label, clip_path, cue, biomes):
+	buf.write(_td_head(defname, label, clip_path) + _TD_CUE + cue + _TD_CUE_END)
+	if biomes: buf.write(_biome_fragment(biomes))
+	buf.write(_TD_CLOSE)
+
+def _emit_battle(buf, defname, label, clip_path, cue, biomes):
+	buf.write(_td_head(defname, label, clip_path) + _TD_CUE + cue + _TD_CUE_END + _TD_TENSE)
+	if biomes: buf.write(_biome_fragment(biomes))
+	buf.write(_TD_CLOSE)
+
+def _emit_custom(buf, defname, label, clip_path, cue_data, biomes):
+	head = _td_head(defname, label, clip_path) + _TD_CUSTOM
+	if cue_data:
+		head += _TD_CUEDATA + cue_data + _TD_CD_END
+	buf.write(head)
+	if biomes: buf.write(_biome_fragment(biomes))
+	buf.write(_TD_CLOSE)
 
 def build_tracks_xml(project_def: ProjectDef):
-	def next_defname():
-		i = 0
-		while True:
-			i += 1
-			yield f"ME_{project_def.game_code}_{i:03d}"
-	gen = next_defname(); next_dn = lambda: next(gen)
-
+	code = project_def.game_code
+	n = 0
+	label_prefix = (project_def.label_prefix or "").strip()
+	content_folder = project_def.content_folder
+	defnames = []  # generation order == theme.xml order
 	sections = {"ambient": [], "maincredits": [], "battle": [], "custom": []}
 	for t in project_def.tracks:
+		label, clip = t.label_clip(label_prefix, content_folder)
 		for use in t.uses:
-			defname = next_dn()
-			label = _compose_label(project_def.label_prefix, t.display_title or t.file_title)
-			clip = f"MusicExpanded/{project_def.content_folder}/{t.idx:03d}. {t.file_title}"
-			entry = {"defname": defname, "label": label, "clip": clip, "cue": None, "cue_data": None, "biomes": use.allowed_biomes or None}
-			if use.cue_type is None:
-				sections["ambient"].append(entry)
-			elif use.cue_type in ("MainMenu","Credits"):
-				entry["cue"] = use.cue_type; sections["maincredits"].append(entry)
-			elif use.cue_type in BATTLE_CUES:
-				entry["cue"] = use.cue_type; sections["battle"].append(entry)
-			elif use.cue_type == "Custom":
-				entry["cue"] = "Custom"; entry["cue_data"] = use.cue_data; sections["custom"].append(entry)
+			n += 1
+			defname = f"ME_{code}_{n:03d}"
+			defnames.append(defname)
+			cue = use.cue_type
+			if cue is None:
+				sections["ambient"].append((defname, label, clip, use.allowed_biomes or None))
+			elif cue in _MC_CUES:
+				sections["maincredits"].append((defname, label, clip, cue, use.allowed_biomes or None))
+			elif cue in BATTLE_CUES:
+				sections["battle"].append((defname, label, clip, cue, use.allowed_biomes or None))
+			elif cue == "Custom":
+				sections["custom"].append((defname, label, clip, use.cue_data, use.allowed_biomes or None))
 			else:
-				sections["ambient"].append(entry)
+				sections["ambient"].append((defname, label, clip, use.allowed_biomes or None))
 
-	lines = ['<?xml version="1.0" encoding="utf-8"?>', '<Defs>']
-	lines.append('\t<!-- Ambient Tracks (No Cue) -->')
+	out = io.StringIO()
+	out.write('<?xml version="1.0" encoding="utf-8"?>\n<Defs>\n')
+	out.write('\t<!-- Ambient Tracks (No Cue) -->\n')
 	for e in sections["ambient"]:
-		lines.append(xml_trackdef(e["defname"], e["label"], e["clip"], e["cue"], e["cue_data"], e["biomes"]))
-	lines.append('')
-	lines.append('\t<!-- MainMenu and Credits Tracks -->')
+		_emit_ambient(out, *e)
+	out.write('\n')
+	out.write('\t<!-- MainMenu and Credits Tracks -->\n')
 	for e in sections["maincredits"]:
-		lines.append(xml_trackdef(e["defname"], e["label"], e["clip"], e["cue"], e["cue_data"], e["biomes"]))
-	lines.append('')
-	lines.append('\t<!-- Battle Tracks (BattleSmall, BattleMedium, BattleLarge, BattleLegendary) -->')
+		_emit_maincredits(out, *e)
+	out.write('\n')
+	out.write('\t<!-- Battle Tracks (BattleSmall, BattleMedium, BattleLarge, BattleLegendary) -->\n')
 	for e in sections["battle"]:
-		lines.append(xml_trackdef(e["defname"], e["label"], e["clip"], e["cue"], e["cue_data"], e["biomes"]))
-	lines.append('')
-	lines.append('\t<!-- Custom Cues (Base Game & DLC) -->')
+		_emit_battle(out, *e)
+	out.write('\n')
+	out.write('\t<!-- Custom Cues (Base Game & DLC) -->\n')
 	for e in sections["custom"]:
-		lines.append(xml_trackdef(e["defname"], e["label"], e["clip"], e["cue"], e["cue_data"], e["biomes"]))
-	lines.append('</Defs>')
-	return "\n".join(lines) + "\n"
+		_emit_custom(out, *e)
+	out.write('</Defs>\n')
+	return out.getvalue(), defnames
 
-def build_theme_xml(project_def: ProjectDef):
-	def next_defname():
-		i = 0
-		while True:
-			i += 1
-			yield f"ME_{project_def.game_code}_{i:03d}"
-	gen = next_defname()
-	defnames = []
-	for t in project_def.tracks:
-		for _use in t.uses:
-			defnames.append(next(gen))
+def build_theme_xml(project_def: ProjectDef, defnames=None):
+	if defnames is None:
+		# standalone call: re-derive the same sequence build_tracks_xml assigns
+		total = sum(len(t.uses) for t in project_def.tracks)
+		defnames = [f"ME_{project_def.game_code}_{i:03d}" for i in range(1, total + 1)]
 
 	# REQUIRED iconPath (never missing)
 	icon_rel = (project_def.icon_rel or "").strip() or f'UI/Icons/{project_def.content_folder or "Game"}'
 
-	lines = ['<?xml version="1.0" encoding="utf-8"?>', '<Defs>']
-	lines.append('\t<MusicExpanded.ThemeDef>')
-	lines.append(f'\t\t<defName>ME_{project_def.game_code}</defName>')
-	lines.append(f'\t\t<label>Music Expanded: {project_def.label_game}</label>')
-	lines.append(f'\t\t<description>{project_def.theme_description}</description>')
-	lines.append(f'\t\t<iconPath>{icon_rel}</iconPath>')
-	lines.append('\t\t<tracks>')
-	lines.append('\t\t\t<!-- tracks listed in the same sequence as tracks.xml -->')
-	for dn in defnames:
-		lines.append(f'\t\t\t<li>{dn}</li>')
-	lines.append('\t\t</tracks>')
-	lines.append('\t</MusicExpanded.ThemeDef>')
-	lines.append('</Defs>')
-	return "\n".join(lines) + "\n"
+	body = "".join(f'\t\t\t<li>{dn}</li>\n' for dn in defnames)
+	return (
+		'<?xml version="1.0" encoding="utf-8"?>\n<Defs>\n'
+		'\t<MusicExpanded.ThemeDef>\n'
+		f'\t\t<defName>ME_{project_def.game_code}</defName>\n'
+		f'\t\t<label>Music Expanded: {project_def.label_game}</label>\n'
+		f'\t\t<description>{project_def.theme_description}</description>\n'
+		f'\t\t<iconPath>{icon_rel}</iconPath>\n'
+		'\t\t<tracks>\n'
+		'\t\t\t<!-- tracks listed in the same sequence as tracks.xml -->\n'
+		f'{body}'
+		'\t\t</tracks>\n'
+		'\t</MusicExpanded.ThemeDef>\n'
+		'</Defs>\n'
+	)
 
 # ---------------- Import helpers ----------------
 def _split_label_pair(lbl: str):
 	if lbl is None: return (None, "")
-	parts = re.split(r'\s+[-–—]\s+', lbl.strip(), maxsplit=1)
+	parts = _RE_LABEL_SPLIT.split(lbl.strip(), maxsplit=1)
 	return (parts[0].strip(), parts[1].strip()) if len(parts)==2 else (None, lbl.strip())
 
+# Parse results memoized by on-disk identity (mtime_ns + size), so re-opening
+# an unchanged mod skips the XML passes entirely.
+_ABOUT_CACHE: dict[str, tuple] = {}
+_DEF_CACHE: dict[str, tuple] = {}
+
 def parse_about_xml(about_dir: Path):
+	# one directory read instead of a stat per probed file
+	try:
+		with os.scandir(about_dir) as it:
+			names = {e.name for e in it}
+	except OSError:
+		return None
+	if "About.xml" not in names: return None
 	about_xml = about_dir / "About.xml"
-	if not about_xml.exists(): return None
-	tree = ET.parse(about_xml); root = tree.getroot()
+	try:
+		st = os.stat(about_xml)
+		ckey = (st.st_mtime_ns, st.st_size)
+	except OSError:
+		ckey = None
+	hit = _ABOUT_CACHE.get(str(about_xml))
+	if hit is not None and ckey is not None and hit[0] == ckey:
+		info = dict(hit[1])
+		info["versions"] = list(info["versions"]); info["load_after"] = list(info["load_after"])
+	else:
+		info = _parse_about_inner(about_xml)
+		if info is None: return None
+		if ckey is not None:
+			_ABOUT_CACHE[str(about_xml)] = (ckey, dict(info))
+	# preview/modicon presence is directory state, not parse output — always fresh
+	info["preview"] = (about_dir / "Preview.png") if "Preview.png" in names else None
+	info["modicon"] = (about_dir / "modicon.png") if "modicon.png" in names else None
+	return info
+
+def _parse_about_inner(about_xml: Path):
+	tree = ET.parse(str(about_xml)); root = tree.getroot()
 	def gx(tag):
 		node = root.find(tag)
 		return node.text if node is not None and node.text is not None else ""
@@ -281,20 +495,26 @@ def parse_about_xml(about_dir: Path):
 	return {
 		"name": name, "author": author, "packageId": pkg,
 		"description": desc, "versions": versions, "load_after": load_after,
-		"preview": (about_dir / "Preview.png" if (about_dir / "Preview.png").exists() else None),
-		"modicon": (about_dir / "modicon.png" if (about_dir / "modicon.png").exists() else None)
 	}
 
-def parse_tracks_xml_root(root, into_pd: ProjectDef):
-	nodes = root.findall(".//MusicExpanded.TrackDef")
-	if not nodes: return False
-	group = {}; prefix_candidates = []; content_folder = None
+def parse_trackdef_nodes(nodes, into_pd: ProjectDef):
+	group = {}; content_folder = None
+	prefix_counts = {}; best_prefix = None; best_count = 0
 	for tdnode in nodes:
-		lbl = tdnode.findtext("label", default="").strip()
-		clip = tdnode.findtext("clipPath", default="").strip()
+		# one pass over the children instead of a find/findtext walk per field
+		lbl = clip = cue_data = ""; cue = None; allowed_biomes = []
+		for child in tdnode:
+			tag = child.tag
+			if tag == "label": lbl = (child.text or "").strip()
+			elif tag == "clipPath": clip = (child.text or "").strip()
+			elif tag == "cue": cue = (child.text or "").strip() or None
+			elif tag == "cueData": cue_data = (child.text or "").strip()
+			elif tag == "allowedBiomes":
+				allowed_biomes = [li.text.strip() for li in child.iter("li") if li.text]
+		if cue != "Custom": cue_data = ""
 
 		idx, file_title = None, None
-		m = re.match(r'^\s*MusicExpanded/([^/]+)/(\d{3})\.\s*(.+?)\s*$', clip)
+		m = _RE_CLIP.match(clip)
 		if m:
 			content_folder = content_folder or m.group(1)
 			try: idx = int(m.group(2))
@@ -304,27 +524,23 @@ def parse_tracks_xml_root(root, into_pd: ProjectDef):
 			file_title = sanitize_component(Path(clip).name)
 
 		left, right = _split_label_pair(lbl)
-		if left: prefix_candidates.append(left)
+		if left:
+			c = prefix_counts[left] = prefix_counts.get(left, 0) + 1
+			if c > best_count:
+				best_prefix, best_count = left, c
 		display_right = right or file_title
 
-		cue = tdnode.findtext("cue", default="").strip() or None
-		cue_data = tdnode.findtext("cueData", default="").strip() if cue == "Custom" else ""
-		allowed_biomes = []
-		ab = tdnode.find("allowedBiomes")
-		if ab is not None:
-			for li in ab.iter("li"):
-				if li.text: allowed_biomes.append(li.text.strip())
-
 		key = clip or file_title
-		if key not in group:
-			group[key] = {"idx": idx, "file_title": file_title, "display": display_right, "uses": []}
-		group[key]["uses"].append(TrackUse(cue, cue_data, allowed_biomes))
+		rec = group.get(key)
+		if rec is None:
+			rec = group[key] = {"idx": idx, "file_title": file_title, "display": display_right, "uses": []}
+		rec["uses"].append(TrackUse(cue, cue_data, allowed_biomes))
 
+	if not group: return False
 	if content_folder:
-		into_pd.content_folder = content_folder
-	if prefix_candidates:
-		from collections import Counter
-		into_pd.label_prefix = Counter(prefix_candidates).most_common(1)[0][0]
+		into_pd.content_folder = sys.intern(content_folder)
+	if best_prefix is not None:
+		into_pd.label_prefix = best_prefix
 
 	items = list(group.items())
 	def _sortkey(it):
@@ -339,11 +555,12 @@ def parse_tracks_xml_root(root, into_pd: ProjectDef):
 		t = Track(idx, fake_path, rec["display"], rec["file_title"])
 		seen = set(); uses = []
 		for u in rec["uses"]:
-			key2 = (u.cue_type, u.cue_data, tuple(sorted(u.allowed_biomes)))
+			key2 = (u.cue_type, u.cue_data, frozenset(u.allowed_biomes))
 			if key2 in seen: continue
 			seen.add(key2); uses.append(u)
 		t.uses = uses if uses else [TrackUse()]
 		into_pd.tracks.append(t)
+	into_pd._next_idx = max((t.idx for t in into_pd.tracks), default=0) + 1
 	return True
 
 def parse_theme_xml_root(root, into_pd: ProjectDef):
@@ -351,10 +568,10 @@ def parse_theme_xml_root(root, into_pd: ProjectDef):
 	if td is None: return False
 	label_node = td.find("label")
 	if label_node is not None and label_node.text:
-		into_pd.label_game = re.sub(r'^\s*Music Expanded:\s*', '', label_node.text.strip())
+		into_pd.label_game = _RE_ME_LABEL.sub('', label_node.text.strip())
 	defname_node = td.find("defName")
 	if defname_node is not None and defname_node.text:
-		m = re.match(r'^\s*ME_([A-Z0-9]+)\s*$', defname_node.text.strip())
+		m = _RE_ME_DEF.match(defname_node.text.strip())
 		if m: into_pd.game_code = m.group(1)
 	desc_node = td.find("description")
 	if desc_node is not None and desc_node.text is not None:
@@ -365,23 +582,76 @@ def parse_theme_xml_root(root, into_pd: ProjectDef):
 		into_pd.icon_rel = icon_node.text.strip()
 	return True
 
+def _iter_trackdefs(tracks_xml):
+	# stream a (potentially large) tracks.xml one TrackDef at a time; peak
+	# memory stays at a single node instead of the whole tree
+	for _evt, elem in ET.iterparse(str(tracks_xml), events=("end",)):
+		if elem.tag == "MusicExpanded.TrackDef":
+			yield elem
+			elem.clear()
+			if _HAVE_LXML:
+				# lxml keeps cleared elements attached; drop them too
+				while elem.getprevious() is not None:
+					del elem.getparent()[0]
+
 def parse_def_folder(def_folder: Path) -> ProjectDef|None:
+	try:
+		with os.scandir(def_folder) as it:
+			names = {e.name for e in it}
+	except OSError:
+		return None
+	if "tracks.xml" not in names or "theme.xml" not in names:
+		return None
 	tracks_xml = def_folder / "tracks.xml"
 	theme_xml = def_folder / "theme.xml"
-	if not tracks_xml.exists() or not theme_xml.exists():
-		return None
 	try:
-		root_theme = ET.parse(theme_xml).getroot()
-		root_tracks = ET.parse(tracks_xml).getroot()
+		st_t = os.stat(tracks_xml); st_h = os.stat(theme_xml)
+		ckey = (st_t.st_mtime_ns, st_t.st_size, st_h.st_mtime_ns, st_h.st_size)
+	except OSError:
+		ckey = None
+	hit = _DEF_CACHE.get(str(def_folder))
+	if hit is not None and ckey is not None and hit[0] == ckey:
+		import copy
+		pd = copy.deepcopy(hit[1])  # caller mutates the ProjectDef freely
+		pd._src_def_dir = def_folder
+		return pd
+	try:
+		root_theme = ET.parse(str(theme_xml)).getroot()
+		pd = ProjectDef(def_folder.name)
+		if not parse_theme_xml_root(root_theme, pd): return None
+		if not parse_trackdef_nodes(_iter_trackdefs(tracks_xml), pd): return None
 	except Exception:
 		return None
-	pd = ProjectDef(def_folder.name)
-	if not parse_theme_xml_root(root_theme, pd): return None
-	if not parse_tracks_xml_root(root_tracks, pd): return None
 	pd._src_def_dir = def_folder
+	if ckey is not None:
+		import copy
+		_DEF_CACHE[str(def_folder)] = (ckey, copy.deepcopy(pd))
 	return pd
 
 # ---------------- GUI ----------------
+def _set_readonly_text(widget, s):
+	# talk to Tcl directly; the Text method wrappers re-parse options on every call
+	w = str(widget); call = widget.tk.call
+	call(w, "configure", "-state", "normal")
+	call(w, "delete", "1.0", "end")
+	call(w, "insert", "1.0", s)
+	call(w, "configure", "-state", "disabled")
+
+def _bulk_insert(tree, rows):
+	# Fill a Treeview with the Tcl insert command cached and column layout
+	# detached, so Tk doesn't re-measure/redraw per row.
+	call = tree.tk.call
+	name = str(tree)
+	cols = tree.cget("displaycolumns")
+	tree.configure(displaycolumns=())
+	try:
+		# insert at the head over a reversed iterator: position 0 never walks
+		# the sibling chain the way repeated "end" appends do
+		for iid, r in reversed(list(rows)):
+			call(name, "insert", "", 0, "-id", iid, "-values", r)
+	finally:
+		tree.configure(displaycolumns=cols)
+
 class App(tk.Tk):
 	def __init__(self):
 		super().__init__()
@@ -413,8 +683,35 @@ class App(tk.Tk):
 		self._tk_texts: list[tk.Text] = []
 		self._auto_grow_map: dict[tk.Text, tuple[int,int]] = {}
 
+		# coalesced refresh scheduling + preview caching
+		self._pending_refresh = None
+		self._pending_kinds: set[str] = set()
+		self._last_preview_sig = None
+		self._preview_cache: dict[int, tuple] = {}  # id(def) -> (fingerprint, tracks_xml, theme_xml)
+		self._last_tracks_xml = None
+		self._last_theme_xml = None
+		self._stale_panes: set[str] = set()  # preview panes waiting for their tab to show
+
+		# background build state
+		self._build_running = False
+		self._build_queue: queue.Queue|None = None
+		self._def_key_set: set[str] = set()
+		self._row_cache: dict[str, tuple] = {}
+		self._selected_biomes: set[str] = set()
+		self._suspend_traces = False
+		self._last_combo_values: list[str]|None = None
+		self._last_combo_text: str|None = None
+		self._fit_jobs: dict = {}
+		self._lbl_job = None
+		self._tip_win: tk.Toplevel|None = None  # one popup shared by all tooltips
+		self._palette = PAL_D if self._dark else PAL_L  # set before any widget asks for colors
+
 		self._build_ui()
-		apply_palette(self, self._dark)
+		apply_palette(self, self._dark)  # synchronous: avoids a flash of unstyled clam
+		self.after_idle(self._post_init)
+
+	def _post_init(self):
+		# first paint happens before any of this is needed
 		self._repaint_texts()
 		self._refresh_previews()
 		self._update_toolbar_states()
@@ -423,25 +720,23 @@ class App(tk.Tk):
 	def _build_ui(self):
 		# Toolbar (left actions, right theme toggle)
 		bar = ttk.Frame(self, padding=(10,6,10,0)); bar.pack(fill="x")
-		for i in range(16): bar.columnconfigure(i, weight=0)
-		bar.columnconfigure(14, weight=1)
-
-		def make_btn(txt, cb, tip=""):
+		bar.columnconfigure(14, weight=1)  # spacer column; the rest default to 0
+
+		btn_defs = (
+			("btn_new",    "🆕 New",       self._new_project,      "Start a new project (.mefproj) — Ctrl+N"),
+			("btn_load",   "📂 Load",      self._open_project_file, "Load project (.mefproj) — Ctrl+L"),
+			("btn_save",   "💾 Save",      self._save_project,      "Save project — Ctrl+S"),
+			("btn_import", "📥 Import",    self._open_mod_folder,   "Import existing MEF mod folder — Ctrl+I"),
+			("btn_overwr", "🔧 Overwrite", self._overwrite,         "Overwrite XMLs in imported mod — Ctrl+Shift+O"),
+			("btn_build",  "🛠 Build",     self._build,             "Build a new mod folder — Ctrl+B"),
+		)
+		for i, (attr, txt, cb, tip) in enumerate(btn_defs):
 			b = ttk.Button(bar, text=txt, command=cb)
-			if tip: self._tooltip(b, tip)
-			return b
-
-		self.btn_new     = make_btn("🆕 New",   self._new_project, "Start a new project (.mefproj) — Ctrl+N")
-		self.btn_load    = make_btn("📂 Load",  self._open_project_file, "Load project (.mefproj) — Ctrl+L")
-		self.btn_save    = make_btn("💾 Save",  self._save_project, "Save project — Ctrl+S")
-		self.btn_import  = make_btn("📥 Import", self._open_mod_folder, "Import existing MEF mod folder — Ctrl+I")
-		self.btn_overwr  = make_btn("🔧 Overwrite", self._overwrite, "Overwrite XMLs in imported mod — Ctrl+Shift+O")
-		self.btn_build   = make_btn("🛠 Build", self._build, "Build a new mod folder — Ctrl+B")
-		self.theme_btn   = ttk.Button(bar, text="🌙", width=3, command=self._toggle_theme)
-		self._tooltip(self.theme_btn, "Toggle light/dark theme")
-
-		for i, b in enumerate((self.btn_new,self.btn_load,self.btn_save,self.btn_import,self.btn_overwr,self.btn_build)):
+			self._tooltip(b, tip)
 			b.grid(row=0, column=i, padx=(0 if i==0 else 6, 6), ipady=2)
+			setattr(self, attr, b)
+		self.theme_btn = ttk.Button(bar, text="🌙", width=3, command=self._toggle_theme)
+		self._tooltip(self.theme_btn, "Toggle light/dark theme")
 		ttk.Label(bar, text="").grid(row=0, column=14, sticky="ew")  # spacer
 		self.theme_btn.grid(row=0, column=15, sticky="e")            # pinned far right
 
@@ -463,6 +758,7 @@ class App(tk.Tk):
 		self.nb.add(self.tab_theme, text="Theme")
 		self.nb.add(self.tab_tracks, text="Track.xml")
 		self.nb.add(self.tab_build, text="Build")
+		self.nb.bind("<<NotebookTabChanged>>", self._maybe_rebuild_previews)
 
 		self._build_about_tab(self.tab_about)
 		self._build_theme_tab(self.tab_theme)
@@ -476,6 +772,7 @@ class App(tk.Tk):
 		self.next_btn = ttk.Button(nav, text="Next ▶", command=self._next_tab)
 		self.prev_btn.pack(side="left")
 		self.next_btn.pack(side="right")
+		self.build_progress = ttk.Progressbar(nav, orient="horizontal", mode="determinate", length=240)
 		self._update_nav()
 
 	# ---------- About tab
@@ -585,6 +882,7 @@ class App(tk.Tk):
 		self.theme_desc_txt.grid(row=5, column=0, columnspan=8, sticky="nsew")
 		self._track_text(self.theme_desc_txt)
 		self._auto_grow(self.theme_desc_txt, min_rows=6, max_rows=20)
+		self.theme_desc_txt.bind("<<Modified>>", self._on_desc_modified)
 
 		# Right column: theme preview + regenerate
 		right = ttk.Frame(tab); right.grid(row=0, column=1, rowspan=2, sticky="nsew")
@@ -682,6 +980,9 @@ class App(tk.Tk):
 		self.biome_vars = {}
 		for i, b in enumerate(DEFAULT_BIOMES):
 			var = tk.BooleanVar(value=False); self.biome_vars[b] = var
+			# mirror into a plain set so Apply Cue never round-trips through Tcl
+			var.trace_add("write", lambda *_, b=b, v=var:
+				self._selected_biomes.add(b) if v.get() else self._selected_biomes.discard(b))
 			ttk.Checkbutton(ab_box, text=b, variable=var).grid(row=i, column=0, sticky="w", padx=6, pady=2)
 
 		# Buttons
@@ -717,37 +1018,49 @@ class App(tk.Tk):
 		ttk.Button(row, text="🛠 Build", command=self._build).pack(side="left")
 
 	# ---------- Utilities (palette/tooltip/auto-grow/nav)
-	def _palette_color(self, key): return getattr(self, "_palette", PAL_D).get(key, "#222")
+	def _palette_color(self, key): return self._palette.get(key, "#222")
+	def _text_palette_kw(self):
+		p = self._palette
+		return dict(bg=p["alt"], fg=p["fg"], insertbackground=p["fg"])
 	def _track_text(self, w: tk.Text):
 		self._tk_texts.append(w)
-		p = getattr(self, "_palette", PAL_D)
-		try: w.configure(bg=p["alt"], fg=p["fg"], insertbackground=p["fg"])
+		kw = self._text_palette_kw()
+		try: w.configure(**kw); w._me_palette = kw
 		except: pass
 	def _repaint_texts(self):
-		p = getattr(self, "_palette", PAL_D)
+		kw = self._text_palette_kw()
 		for w in self._tk_texts:
-			try: w.configure(bg=p["alt"], fg=p["fg"], insertbackground=p["fg"])
+			if getattr(w, "_me_palette", None) == kw: continue  # already painted this palette
+			try: w.configure(**kw); w._me_palette = kw
 			except: pass
 	def _tooltip(self, widget, text: str):
-		tip = tk.Toplevel(widget); tip.withdraw(); tip.overrideredirect(True)
-		lbl = tk.Label(tip, text=text, background="#111", foreground="#eee", bd=1, relief="solid", padx=6, pady=3)
-		lbl.pack()
+		if self._tip_win is None:
+			self._tip_win = tk.Toplevel(self); self._tip_win.withdraw(); self._tip_win.overrideredirect(True)
+			self._tip_lbl = tk.Label(self._tip_win, text="", background="#111", foreground="#eee", bd=1, relief="solid", padx=6, pady=3)
+			self._tip_lbl.pack()
 		def enter(_):
-			tip.deiconify()
+			self._tip_lbl.configure(text=text)
 			x = widget.winfo_rootx() + widget.winfo_width()//2
 			y = widget.winfo_rooty() + widget.winfo_height() + 8
-			tip.geometry(f"+{x}+{y}")
-		def leave(_): tip.withdraw()
+			self._tip_win.geometry(f"+{x}+{y}")
+			self._tip_win.deiconify()
+		def leave(_): self._tip_win.withdraw()
 		widget.bind("<Enter>", enter); widget.bind("<Leave>", leave)
 
 	def _auto_grow(self, txt: tk.Text, min_rows=3, max_rows=12):
 		self._auto_grow_map[txt] = (min_rows, max_rows)
 		def _fit(_evt=None):
-			lines = int(float(txt.index("end-1c").split(".")[0]))
+			self._fit_jobs.pop(txt, None)
+			lines = int(txt.index("end-1c").partition(".")[0])
 			txt.configure(height=max(min_rows, min(max_rows, lines)))
-		txt.bind("<KeyRelease>", _fit)
-		txt.bind("<<Paste>>", _fit)
-		self.after(50, _fit)
+		def _schedule_fit(_evt=None):
+			# collapse a burst of keystrokes into one height recompute
+			job = self._fit_jobs.get(txt)
+			if job: self.after_cancel(job)
+			self._fit_jobs[txt] = self.after(60, _fit)
+		txt.bind("<KeyRelease>", _schedule_fit)
+		txt.bind("<<Paste>>", _schedule_fit)
+		_fit()  # callers insert their initial text before wiring auto-grow
 
 	def _toggle_theme(self):
 		self._dark = not self._dark
@@ -778,27 +1091,39 @@ class App(tk.Tk):
 	# ---------- Def controls (in Theme tab)
 	def _refresh_all_def_controls(self):
 		names = [d.label_game for d in self.defs]
-		self.def_combo.configure(values=names)
-		if 0 <= self.cur_def_idx.get() < len(names):
-			self.def_combo.current(self.cur_def_idx.get())
-		elif names:
-			self.cur_def_idx.set(0); self.def_combo.current(0)
-		else:
-			self.def_combo.set("")
+		self._def_key_set = {_norm(n) for n in names}
+		if names != self._last_combo_values:
+			self.def_combo.configure(values=names)
+			self._last_combo_values = names
+		idx = self.cur_def_idx.get()
+		if not (0 <= idx < len(names)) and names:
+			idx = 0; self.cur_def_idx.set(0)
+		want_text = names[idx] if names else ""
+		if want_text != self._last_combo_text:
+			# only cross into Tcl when the shown selection actually changes
+			if names: self.def_combo.current(idx)
+			else: self.def_combo.set("")
+			self._last_combo_text = want_text
 
 		d = self._curdef()
-		if d:
-			self.game_label.set(d.label_game)
-			self.game_code.set(d.game_code)
-			self.content_folder.set(d.content_folder)
-			self.label_prefix.set(d.label_prefix)
-			self.icon_rel_var.set(d.icon_rel or f'UI/Icons/{d.content_folder or "Game"}')
-			self.theme_desc_txt.delete("1.0","end"); self.theme_desc_txt.insert("1.0", d.theme_description)
-			self.def_folder_lbl.configure(text=f"Def folder: {d._src_def_dir}" if d._src_def_dir else "Def folder: (new/not from disk)")
-		else:
-			self.game_label.set(""); self.game_code.set(""); self.content_folder.set(""); self.label_prefix.set("")
-			self.icon_rel_var.set("")
-			self.theme_desc_txt.delete("1.0","end"); self.def_folder_lbl.configure(text="Def folder: (none)")
+		# view update only: don't let the var traces write straight back into
+		# the model (and rebuild previews) once per field we set here
+		self._suspend_traces = True
+		try:
+			if d:
+				self.game_label.set(d.label_game)
+				self.game_code.set(d.game_code)
+				self.content_folder.set(d.content_folder)
+				self.label_prefix.set(d.label_prefix)
+				self.icon_rel_var.set(d.icon_rel or f'UI/Icons/{d.content_folder or "Game"}')
+				self.theme_desc_txt.delete("1.0","end"); self.theme_desc_txt.insert("1.0", d.theme_description)
+				self.def_folder_lbl.configure(text=f"Def folder: {d._src_def_dir}" if d._src_def_dir else "Def folder: (new/not from disk)")
+			else:
+				self.game_label.set(""); self.game_code.set(""); self.content_folder.set(""); self.label_prefix.set("")
+				self.icon_rel_var.set("")
+				self.theme_desc_txt.delete("1.0","end"); self.def_folder_lbl.configure(text="Def folder: (none)")
+		finally:
+			self._suspend_traces = False
 
 		self._refresh_tracks_table(); self._refresh_previews()
 		self._update_toolbar_states()
@@ -812,12 +1137,13 @@ class App(tk.Tk):
 				return
 
 	def _add_def(self):
+		from tkinter import simpledialog
 		name = simpledialog.askstring(APP_TITLE, "New Def name")
 		if name is None: return
 		name = name.strip()
 		if not name:
 			messagebox.showerror(APP_TITLE, "Please enter a non-empty Def name."); return
-		if any(x.label_game.strip().lower() == name.lower() for x in self.defs):
+		if _norm(name) in self._def_key_set:
 			messagebox.showerror(APP_TITLE, "A Def with that name already exists."); return
 		pd = ProjectDef(name)
 		self.defs.append(pd)
@@ -837,12 +1163,14 @@ class App(tk.Tk):
 	def _rename_def(self):
 		d = self._curdef()
 		if not d: return
+		from tkinter import simpledialog
 		name = simpledialog.askstring(APP_TITLE, "Rename Def", initialvalue=d.label_game)
 		if name is None: return
 		name = name.strip()
 		if not name:
 			messagebox.showerror(APP_TITLE, "Please enter a non-empty Def name."); return
-		if any(x is not d and x.label_game.strip().lower() == name.lower() for x in self.defs):
+		key = _norm(name)
+		if key != _norm(d.label_game) and key in self._def_key_set:
 			messagebox.showerror(APP_TITLE, "A Def with that name already exists."); return
 		d.label_game = name
 		if not d.game_code: d.game_code = infer_game_code(name)
@@ -862,16 +1190,30 @@ class App(tk.Tk):
 		self._refresh_all_def_controls()
 
 	def _on_core_changed(self, *_):
+		if self._suspend_traces: return
 		d = self._curdef()
 		if not d: return
-		d.label_game = self.game_label.get().strip() or d.label_game
+		new_label = self.game_label.get().strip() or d.label_game
+		if new_label != d.label_game:
+			d.label_game = new_label
+			self._def_key_set = {_norm(x.label_game) for x in self.defs}
 		d.game_code = self.game_code.get().strip() or d.game_code
 		d.content_folder = self.content_folder.get().strip() or d.content_folder
 		d.label_prefix = self.label_prefix.get()
-		d.theme_description = self.theme_desc_txt.get("1.0","end").strip() or d.theme_description
 		# REQUIRED: always maintain a non-empty icon_rel
 		d.icon_rel = (self.icon_rel_var.get().strip() or f'UI/Icons/{sanitize_simple(d.label_game) or d.content_folder or "Game"}')
-		self._refresh_previews()
+		self._schedule_preview_refresh()
+
+	def _on_desc_modified(self, _evt=None):
+		# description edits come through the Text's own modified flag, so the
+		# four StringVar traces never copy the (large) description per keypress
+		if not self.theme_desc_txt.edit_modified(): return
+		self.theme_desc_txt.edit_modified(False)
+		if self._suspend_traces: return
+		d = self._curdef()
+		if not d: return
+		d.theme_description = self.theme_desc_txt.get("1.0","end").strip() or d.theme_description
+		self._schedule_preview_refresh()
 
 	# ---------- Tracks
 	def _add_tracks_from_folder(self):
@@ -880,14 +1222,14 @@ class App(tk.Tk):
 			messagebox.showerror(APP_TITLE, "Create/select a Def first."); return
 		root = filedialog.askdirectory(title="Add folder of .ogg files (recursive)")
 		if not root: return
-		files = sorted(Path(root).rglob("*.ogg"), key=lambda p: p.as_posix().lower())
+		files = [Path(p) for p in sorted(_iter_ogg(root), key=str.lower)]
 		if not files:
 			messagebox.showerror(APP_TITLE, "No .ogg found in that folder."); return
-		start = max([t.idx for t in d.tracks], default=0) + 1
-		for j, p in enumerate(files):
+		for p in files:
 			disp = infer_title_from_filename(p.name, d.label_game, d.content_folder)
 			filet = sanitize_component(disp)
-			d.tracks.append(Track(start+j, p, disp, filet))
+			d.tracks.append(Track(d._next_idx, p, disp, filet))
+			d._next_idx += 1
 		self._refresh_tracks_table(); self._refresh_previews()
 
 	def _add_track_files(self):
@@ -896,36 +1238,58 @@ class App(tk.Tk):
 			messagebox.showerror(APP_TITLE, "Create/select a Def first."); return
 		fs = filedialog.askopenfilenames(title="Add .ogg files", filetypes=[("OGG","*.ogg")])
 		if not fs: return
-		start = max([t.idx for t in d.tracks], default=0) + 1
-		for j, fp in enumerate(fs):
+		for fp in fs:
 			p = Path(fp)
 			disp = infer_title_from_filename(p.name, d.label_game, d.content_folder)
 			filet = sanitize_component(disp)
-			d.tracks.append(Track(start+j, p, disp, filet))
+			d.tracks.append(Track(d._next_idx, p, disp, filet))
+			d._next_idx += 1
 		self._refresh_tracks_table(); self._refresh_previews()
 
 	def _refresh_tracks_table(self):
 		if not hasattr(self, "tracks_tree"): return
-		for iid in self.tracks_tree.get_children(): self.tracks_tree.delete(iid)
+		tree = self.tracks_tree
 		d = self._curdef()
-		if not d: return
-		for t in d.tracks:
-			self.tracks_tree.insert("", "end",
-				values=(f"{t.idx:03d}", t.path.name, t.display_title, ", ".join(u.summary() for u in t.uses)))
+		cache = self._row_cache
+		want = {str(t.idx): (f"{t.idx:03d}", t.path.name, t.display_title, t.uses_summary())
+		        for t in d.tracks} if d else {}
+		if not cache:
+			# freeze/thaw: unmap the tree during the bulk fill so Tk does one
+			# geometry pass instead of reflowing per batch
+			tree.grid_remove()
+			try:
+				_bulk_insert(tree, want.items())
+			finally:
+				tree.grid()
+			self._row_cache = want
+			return
+		gone = [iid for iid in cache if iid not in want]
+		if gone:
+			tree.delete(*gone)
+		insert = tree.insert; item = tree.item; old_row = cache.get
+		for iid, vals in want.items():
+			old = old_row(iid)
+			if old is None:
+				insert("", "end", iid=iid, values=vals)
+			elif old != vals:
+				item(iid, values=vals)
+		self._row_cache = want
 
 	def _on_track_select(self):
 		t = self._current_track()
 		if not t: return
-		self.track_label.set(t.display_title)
-		for b in self.biome_vars: self.biome_vars[b].set(False)
+		self._suspend_traces = True
+		try:
+			self.track_label.set(t.display_title)
+			for b in self.biome_vars: self.biome_vars[b].set(False)
+		finally:
+			self._suspend_traces = False
+		self._selected_biomes.clear()
 
 	def _current_track(self) -> Track|None:
 		d = self._curdef(); sel = self.tracks_tree.selection() if hasattr(self, "tracks_tree") else []
 		if not d or not sel: return None
-		idx = int(self.tracks_tree.item(sel[0], "values")[0])
-		for t in d.tracks:
-			if t.idx == idx: return t
-		return None
+		return d.track_by_idx(int(sel[0]))  # row iid == track idx
 
 	def _selected_tracks(self):
 		d = self._curdef()
@@ -934,18 +1298,26 @@ class App(tk.Tk):
 		if not sels:
 			t = self._current_track()
 			return [t] if t else []
-		idxs = {int(self.tracks_tree.item(i, "values")[0]) for i in sels}
+		idxs = {int(i) for i in sels}
 		return [t for t in d.tracks if t.idx in idxs]
 
 	def _collect_biomes_from_ui(self):
-		return [b for b,v in self.biome_vars.items() if v.get()]
+		sel = self._selected_biomes
+		return [b for b in self.biome_vars if b in sel]
 
 	def _on_track_label_changed(self, *_):
+		if self._suspend_traces: return
+		# trace fires per keystroke; only the last edit in a burst does work
+		if self._lbl_job: self.after_cancel(self._lbl_job)
+		self._lbl_job = self.after(150, self._do_label_changed)
+
+	def _do_label_changed(self):
+		self._lbl_job = None
 		txt = self.track_label.get().strip()
 		if not txt: return
 		for t in self._selected_tracks():
 			t.display_title = txt
-		self._refresh_tracks_table(); self._refresh_previews()
+		self._schedule_refresh(("table","previews"))
 
 	def _apply_queue(self):
 		targets = self._selected_tracks()
@@ -964,21 +1336,21 @@ class App(tk.Tk):
 
 		new_right_label = self.track_label.get().strip()
 
+		replace_ambient = self.replace_ambient.get()
+		TU = TrackUse  # local binding skips a global lookup per target
+		proto_cue, proto_data, proto_biomes = new_use_proto.cue_type, new_use_proto.cue_data, new_use_proto.allowed_biomes
 		for t in targets:
-			new_use = TrackUse(new_use_proto.cue_type, new_use_proto.cue_data, list(new_use_proto.allowed_biomes))
-			if self.replace_ambient.get() and len(t.uses)==1 and t.uses[0].cue_type is None and new_use.cue_type is not None:
+			new_use = TU(proto_cue, proto_data, list(proto_biomes))
+			if replace_ambient and len(t.uses)==1 and t.uses[0].cue_type is None and new_use.cue_type is not None:
 				t.uses[0] = new_use
 			else:
-				def matches(u: TrackUse):
-					if new_use.cue_type is None: return u.cue_type is None
-					if new_use.cue_type == "Custom": return u.cue_type=="Custom" and u.cue_data==new_use.cue_data
-					return u.cue_type == new_use.cue_type
-				for i,u in enumerate(list(t.uses)):
-					if matches(u):
-						t.uses[i] = new_use
-						break
+				idx_by_key = {u.key(): i for i, u in enumerate(t.uses)}
+				i = idx_by_key.get(new_use.key())
+				if i is not None:
+					t.uses[i] = new_use
 				else:
 					t.uses.append(new_use)
+			t._uses_summary = None
 			if new_right_label:
 				t.display_title = new_right_label
 
@@ -989,64 +1361,125 @@ class App(tk.Tk):
 		if not targets:
 			messagebox.showinfo(APP_TITLE, "Select one or more tracks."); return
 		cue_disp = self.cue_choice.get(); cd = self.cue_data.get().strip()
+		if cue_disp == "Ambient": key = (None, "")
+		elif cue_disp == "Custom": key = ("Custom", cd)
+		else: key = (cue_disp, "")
 		for t in targets:
-			def idx_for():
-				if cue_disp == "Ambient":
-					for i,u in enumerate(t.uses):
-						if u.cue_type is None: return i
-				elif cue_disp == "Custom":
-					for i,u in enumerate(t.uses):
-						if u.cue_type=="Custom" and u.cue_data==cd: return i
-				else:
-					for i,u in enumerate(t.uses):
-						if u.cue_type == cue_disp: return i
-				return -1
-			i = idx_for()
+			i = next((i for i, u in enumerate(t.uses) if u.key() == key), -1)
 			if i >= 0:
 				t.uses.pop(i)
+				t._uses_summary = None
 				if not t.uses:
 					t.uses = [TrackUse()]
 		self._refresh_tracks_table(); self._refresh_previews()
 
 	# ---------- Previews
+	def _preview_xml_for(self, d: ProjectDef):
+		# both previews come from one cached render per Def fingerprint
+		fp = d._fingerprint()
+		hit = self._preview_cache.get(id(d))
+		if hit is not None and hit[0] == fp:
+			return hit[1], hit[2]
+		tracks_xml, defnames = build_tracks_xml(d)
+		theme_xml = build_theme_xml(d, defnames)
+		self._preview_cache[id(d)] = (fp, tracks_xml, theme_xml)
+		return tracks_xml, theme_xml
+
+	def _patch_text(self, widget, old, new):
+		# rewrite only the changed tail — full replaces make Tk rebuild tags/undo state
+		if not old:
+			_set_readonly_text(widget, new); return
+		w = str(widget); call = widget.tk.call
+		call(w, "configure", "-state", "normal")
+		pfx = len(os.path.commonprefix((old, new)))
+		call(w, "delete", f"1.0+{pfx}c", "end")
+		call(w, "insert", "end", new[pfx:])
+		call(w, "configure", "-state", "disabled")
 	def _refresh_tracks_preview(self):
 		d = self._curdef()
-		xml = build_tracks_xml(d) if d else "<!-- No Def selected -->\n"
-		self.tracks_preview.configure(state="normal"); self.tracks_preview.delete("1.0","end"); self.tracks_preview.insert("1.0", xml); self.tracks_preview.configure(state="disabled")
+		xml = self._preview_xml_for(d)[0] if d else "<!-- No Def selected -->\n"
+		if xml == self._last_tracks_xml: return
+		prev = self._last_tracks_xml; self._last_tracks_xml = xml
+		self._patch_text(self.tracks_preview, prev, xml)
 	def _refresh_theme_preview(self):
 		d = self._curdef()
-		xml = build_theme_xml(d) if d else "<!-- No Def selected -->\n"
-		self.theme_preview.configure(state="normal"); self.theme_preview.delete("1.0","end"); self.theme_preview.insert("1.0", xml); self.theme_preview.configure(state="disabled")
+		xml = self._preview_xml_for(d)[1] if d else "<!-- No Def selected -->\n"
+		if xml == self._last_theme_xml: return
+		prev = self._last_theme_xml; self._last_theme_xml = xml
+		self._patch_text(self.theme_preview, prev, xml)
+	def _preview_sig(self):
+		d = self._curdef()
+		if not d: return None
+		return (id(d), d._fingerprint())
+
+	def _schedule_refresh(self, kinds=("previews",)):
+		# coalesce rapid-fire events (typing, bulk edits) into one refresh pass
+		self._pending_kinds.update(kinds)
+		if self._pending_refresh is None:
+			self._pending_refresh = self.after(50, self._do_refresh)
+
+	def _do_refresh(self):
+		self._pending_refresh = None
+		kinds, self._pending_kinds = self._pending_kinds, set()
+		if "table" in kinds: self._refresh_tracks_table()
+		if "previews" in kinds: self._refresh_previews()
+
+	def _schedule_preview_refresh(self):
+		self._schedule_refresh(("previews",))
+
 	def _refresh_previews(self):
-		if hasattr(self, "tracks_preview"): self._refresh_tracks_preview()
-		if hasattr(self, "theme_preview"):  self._refresh_theme_preview()
-		self._update_build_panel()
+		sig = self._preview_sig()
+		if sig is not None and sig == self._last_preview_sig and not self._stale_panes: return
+		self._last_preview_sig = sig
+		# mark every pane stale; only the one on screen rebuilds now, the rest
+		# catch up when their tab is shown
+		self._stale_panes = {"tracks", "theme", "build"}
+		self._maybe_rebuild_previews()
+
+	def _maybe_rebuild_previews(self, _event=None):
+		if not self._stale_panes or not hasattr(self, "nb"): return
+		tab = self.nb.select()
+		if tab == str(self.tab_tracks) and "tracks" in self._stale_panes and hasattr(self, "tracks_preview"):
+			self._stale_panes.discard("tracks"); self._refresh_tracks_preview()
+		elif tab == str(self.tab_theme) and "theme" in self._stale_panes and hasattr(self, "theme_preview"):
+			self._stale_panes.discard("theme"); self._refresh_theme_preview()
+		elif tab == str(self.tab_build) and "build" in self._stale_panes:
+			self._stale_panes.discard("build"); self._update_build_panel()
 
 	# ---------- Build panel
 	def _update_build_panel(self):
-		lines = []
-		lines.append("BUILD PREFLIGHT SUMMARY\n")
+		# only the per-def summary is dynamic; the Steam rules text is constant
 		if not self.defs:
-			lines.append("- No Defs created.\n")
+			per_def = "- No Defs created.\n"
 		else:
-			for d in self.defs:
-				a=m=b=cu=0
-				for t in d.tracks:
-					for u in t.uses:
-						if u.cue_type is None: a+=1
-						elif u.cue_type in ("MainMenu","Credits"): m+=1
-						elif u.cue_type in BATTLE_CUES: b+=1
-						elif u.cue_type=="Custom": cu+=1
-				lines.append(f"- {d.label_game}: ambient {a}, main/credits {m}, battle {b}, custom {cu}\n")
-		lines.append("\nSTEAM WORKSHOP CONTENT & COMMUNITY RULES (brief)\n")
-		lines.append("• Only upload content you own or have permission to use.\n")
-		lines.append("• No malware, scams, or illegal content; respect local laws.\n")
-		lines.append("• No harassment/hate speech; follow DMCA takedowns.\n")
-		lines.append("• Provide accurate descriptions/tags; avoid spam.\n")
-		self.build_info.configure(state="normal"); self.build_info.delete("1.0","end"); self.build_info.insert("1.0","".join(lines)); self.build_info.configure(state="disabled")
+			def _line(d):
+				c = Counter(_CUE_CAT.get(u.cue_type, "cu") for t in d.tracks for u in t.uses)
+				return f"- {d.label_game}: ambient {c['a']}, main/credits {c['m']}, battle {c['b']}, custom {c['cu']}\n"
+			per_def = "".join(_line(d) for d in self.defs)
+		text = "BUILD PREFLIGHT SUMMARY\n" + per_def + _STEAM_RULES
+		_set_readonly_text(self.build_info, text)
 
 	# ---------- Project save/open
 	def _serialize(self):
+		# flat layout: tracks/uses are top-level record lists keyed back by
+		# def_id/track_id, so the encoder sees shallow objects
+		tracks = []; uses = []
+		for di, d in enumerate(self.defs):
+			for t in d.tracks:
+				for u in t.uses:
+					uses.append({
+						"track_id": len(tracks),
+						"cue_type": u.cue_type,
+						"cue_data": u.cue_data,
+						"allowed_biomes": u.allowed_biomes
+					})
+				tracks.append({
+					"def_id": di,
+					"idx": t.idx,
+					"path": str(t.path),
+					"display_title": t.display_title,
+					"file_title": t.file_title,
+				})
 		return {
 			"about": {
 				"name": self.about_name.get(),
@@ -1066,18 +1499,9 @@ class App(tk.Tk):
 				"theme_description": d.theme_description,
 				"icon_rel": d.icon_rel,
 				"icon_src": (str(d.icon_src) if d.icon_src else ""),
-				"tracks": [{
-					"idx": t.idx,
-					"path": str(t.path),
-					"display_title": t.display_title,
-					"file_title": t.file_title,
-					"uses": [{
-						"cue_type": u.cue_type,
-						"cue_data": u.cue_data,
-						"allowed_biomes": u.allowed_biomes
-					} for u in t.uses]
-				} for t in d.tracks]
-			} for d in self.defs]
+			} for d in self.defs],
+			"tracks": tracks,
+			"uses": uses,
 		}
 
 	def _load_from_dict(self, data: dict):
@@ -1091,6 +1515,7 @@ class App(tk.Tk):
 		self.preview_src.set(a.get("preview","")); self.modicon_src.set(a.get("modicon",""))
 
 		self.defs.clear()
+		TU = TrackUse; Tr = Track; Pth = Path  # hot loops below — keep lookups local
 		for d in data.get("defs", []):
 			pd = ProjectDef(d.get("label_game",""))
 			pd.game_code = d.get("game_code", pd.game_code)
@@ -1100,26 +1525,50 @@ class App(tk.Tk):
 			pd.icon_rel = d.get("icon_rel", pd.icon_rel)
 			icon_src_s = d.get("icon_src","")
 			pd.icon_src = Path(icon_src_s) if icon_src_s else None
+			# legacy nested layout: tracks/uses embedded in the def record
 			for t in d.get("tracks", []):
-				tr = Track(t["idx"], Path(t["path"]), t["display_title"], t["file_title"])
-				tr.uses = [TrackUse(u.get("cue_type"), u.get("cue_data",""), u.get("allowed_biomes",[])) for u in t.get("uses",[])]
-				if not tr.uses: tr.uses=[TrackUse()]
+				tr = Tr(t["idx"], Pth(t["path"]), t["display_title"], t["file_title"])
+				tr.uses = [TU(u.get("cue_type"), u.get("cue_data",""), u.get("allowed_biomes",[])) for u in t.get("uses",[])]
+				if not tr.uses: tr.uses=[TU()]
 				pd.tracks.append(tr)
 			self.defs.append(pd)
+
+		# flat layout: top-level track/use records pointing back at their owners
+		track_objs = []
+		for t in data.get("tracks", []):
+			tr = Tr(t["idx"], Pth(t["path"]), t["display_title"], t["file_title"])
+			tr.uses = []
+			track_objs.append(tr)
+			self.defs[t["def_id"]].tracks.append(tr)
+		for u in data.get("uses", []):
+			track_objs[u["track_id"]].uses.append(
+				TU(u.get("cue_type"), u.get("cue_data",""), u.get("allowed_biomes",[])))
+		for tr in track_objs:
+			if not tr.uses: tr.uses = [TU()]
+
+		for pd in self.defs:
+			pd._next_idx = max((t.idx for t in pd.tracks), default=0) + 1
 		self.cur_def_idx.set(0 if self.defs else -1)
 		self._refresh_all_def_controls()
 
 	def _save_project(self):
 		p = filedialog.asksaveasfilename(defaultextension=".mefproj", filetypes=[("MEF Project",".mefproj")])
 		if not p: return
-		Path(p).write_text(json.dumps(self._serialize(), indent=2), encoding="utf-8")
+		data = self._serialize()
+		if orjson is not None:
+			Path(p).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+		else:
+			# stream straight into the file: no full-document string in memory
+			with open(p, "w", encoding="utf-8", newline="\n") as f:
+				json.dump(data, f, indent=2)
 		messagebox.showinfo(APP_TITLE, "Project saved.")
 
 	def _open_project_file(self):
 		p = filedialog.askopenfilename(filetypes=[("MEF Project",".mefproj"), ("JSON",".json"), ("All","*.*")])
 		if not p: return
 		try:
-			data = json.loads(Path(p).read_text(encoding="utf-8"))
+			raw = Path(p).read_bytes()
+			data = orjson.loads(raw) if orjson is not None else json.loads(raw)
 			self._load_from_dict(data)
 			messagebox.showinfo(APP_TITLE, "Project loaded.")
 		except Exception as e:
@@ -1157,12 +1606,13 @@ class App(tk.Tk):
 			self.load_after_txt.delete("1.0","end"); self.load_after_txt.insert("1.0", "\n".join(info["load_after"]) if info["load_after"] else self.about_load_after_default)
 			self.desc_txt.delete("1.0","end"); self.desc_txt.insert("1.0", info["description"] or "")
 
+		children = [c for c in sorted(defs_dir.iterdir())
+		            if c.is_dir() and c.name.lower() != "patches"]
 		new_defs = []
-		for child in sorted(defs_dir.iterdir()):
-			if not child.is_dir(): continue
-			if child.name.lower() == "patches": continue
-			pd = parse_def_folder(child)
-			if pd: new_defs.append(pd)
+		if children:
+			# each Def folder parses independently (XML + disk reads), so fan out
+			with ThreadPoolExecutor(max_workers=min(8, len(children))) as ex:
+				new_defs = [pd for pd in ex.map(parse_def_folder, children) if pd]
 
 		if not new_defs:
 			messagebox.showerror(APP_TITLE, "No valid Defs found (need Defs/<Something>/tracks.xml + theme.xml)."); return
@@ -1202,63 +1652,136 @@ class App(tk.Tk):
 		return True
 
 	def _build(self):
+		if self._build_running: return
 		if not self._preflight_ok(False): return
+		from tkinter import simpledialog
 		outroot = Path(self.out_root.get().strip()); outroot.mkdir(parents=True, exist_ok=True)
 		mod_name = simpledialog.askstring(APP_TITLE, "Name the output mod folder")
 		if not mod_name: return
 		mod_dir = outroot / sanitize_component(mod_name)
 		if mod_dir.exists():
 			if not messagebox.askyesno(APP_TITLE, f"Folder exists:\n{mod_dir}\n\nOverwrite?"): return
-			shutil.rmtree(mod_dir)
-		mod_dir.mkdir(parents=True, exist_ok=True)
-
-		# About
-		about_dir = mod_dir / "About"; about_dir.mkdir(parents=True, exist_ok=True)
-		desc = self.desc_txt.get("1.0","end").strip()
-		vers_lines = self._get_versions_lines()
-		la_lines = self._get_load_after_lines()
-		about_xml = build_about_xml(self.about_name.get().strip(), desc, self.about_author.get().strip(),
-			self.about_package.get().strip(), vers_lines, la_lines)
-		(about_dir / "About.xml").write_text(about_xml, encoding="utf-8", newline="\n")
-		if self.preview_src.get().strip(): shutil.copy2(self.preview_src.get().strip(), about_dir / "Preview.png")
-		if self.modicon_src.get().strip(): shutil.copy2(self.modicon_src.get().strip(), about_dir / "modicon.png")
-
-		# Folders
-		defs_root = mod_dir / "Defs"; defs_root.mkdir(parents=True, exist_ok=True)
-		sounds_root = mod_dir / "Sounds" / "MusicExpanded"; sounds_root.mkdir(parents=True, exist_ok=True)
-		textures_root = mod_dir / "Textures"  # for theme icon PNGs
-
-		dest_folders = set()
-		for d in self.defs:
-			dfolder_name = sanitize_simple(d.label_game) or d.content_folder or "Game"
-			if dfolder_name in dest_folders:
-				messagebox.showerror(APP_TITLE, f"Duplicate Def folder would be created: {dfolder_name}\nRename one of your Defs."); return
-			dest_folders.add(dfolder_name)
-
-			dfolder = defs_root / dfolder_name
-			dfolder.mkdir(parents=True, exist_ok=True)
-			(dfolder / "tracks.xml").write_text(build_tracks_xml(d), encoding="utf-8", newline="\n")
-			(dfolder / "theme.xml").write_text(build_theme_xml(d), encoding="utf-8", newline="\n")
-
-			# Copy icon if provided (iconPath is required in XML either way)
-			if (d.icon_rel or "").strip() and d.icon_src and Path(d.icon_src).exists():
-				target_png = textures_root / (d.icon_rel + ".png")
-				target_png.parent.mkdir(parents=True, exist_ok=True)
-				try: shutil.copy2(d.icon_src, target_png)
-				except Exception as e: messagebox.showwarning(APP_TITLE, f"Failed to copy theme icon for {d.label_game}: {e}")
-
-			# Audio
-			dest_folder = sounds_root / d.content_folder
-			dest_folder.mkdir(parents=True, exist_ok=True)
-			for t in d.tracks:
-				target_name = f"{t.idx:03d}. {t.file_title}.ogg"
-				try: shutil.copy2(t.path, dest_folder / target_name)
-				except Exception as e: messagebox.showwarning(APP_TITLE, f"Failed to copy {t.path.name}: {e}")
 
+		dest_folders = {sanitize_simple(d.label_game) or d.content_folder or "Game" for d in self.defs}
+		if len(dest_folders) != len(self.defs):
+			messagebox.showerror(APP_TITLE, "Two Defs would share the same output folder.\nRename one of your Defs."); return
+
+		# Snapshot everything the worker needs while we're still on the Tk thread
+		about_xml = build_about_xml(self.about_name.get().strip(), self.desc_txt.get("1.0","end").strip(),
+			self.about_author.get().strip(), self.about_package.get().strip(),
+			self._get_versions_lines(), self._get_load_after_lines())
+		preview_src = self.preview_src.get().strip()
+		modicon_src = self.modicon_src.get().strip()
+		defs = list(self.defs)
+
+		self._build_running = True
+		self._set_build_buttons(False)
+		self.build_progress.configure(value=0, maximum=1)
+		self.build_progress.pack(side="right", padx=8)
+		self._build_queue = queue.Queue()
+		threading.Thread(target=self._build_worker,
+			args=(self._build_queue, mod_dir, about_xml, preview_src, modicon_src, defs), daemon=True).start()
+		self.after(50, self._drain_build_queue)
+
+	def _drain_build_queue(self):
+		# Tk-side end of the worker bridge: all widget updates happen here.
+		q = self._build_queue
+		if q is None: return
+		while True:
+			try: msg = q.get_nowait()
+			except queue.Empty: break
+			if msg[0] == "progress":
+				self._set_build_progress(msg[1], msg[2])
+			elif msg[0] == "done":
+				self._build_queue = None
+				self._build_done(msg[1], msg[2])
+				return
+		self.after(50, self._drain_build_queue)
+
+	def _build_worker(self, q: "queue.Queue", mod_dir: Path, about_xml: str, preview_src: str, modicon_src: str, defs):
+		# Runs off the Tk thread: all dialogs/widget access stay in _build/_build_done.
+		import shutil
+		errors = []
+		try:
+			if mod_dir.exists(): shutil.rmtree(mod_dir)
+			mod_dir.mkdir(parents=True, exist_ok=True)
+
+			about_dir = mod_dir / "About"; about_dir.mkdir(parents=True, exist_ok=True)
+			_write_if_changed(about_dir / "About.xml", about_xml)
+
+			defs_root = mod_dir / "Defs"; defs_root.mkdir(parents=True, exist_ok=True)
+			sounds_root = mod_dir / "Sounds" / "MusicExpanded"; sounds_root.mkdir(parents=True, exist_ok=True)
+			textures_root = mod_dir / "Textures"  # for theme icon PNGs
+
+			copy_pairs = []
+			if preview_src: copy_pairs.append((Path(preview_src), about_dir / "Preview.png"))
+			if modicon_src: copy_pairs.append((Path(modicon_src), about_dir / "modicon.png"))
+
+			for d in defs:
+				dfolder_name = sanitize_simple(d.label_game) or d.content_folder or "Game"
+				dfolder = defs_root / dfolder_name
+				dfolder.mkdir(parents=True, exist_ok=True)
+				tracks_xml, defnames = build_tracks_xml(d)
+				_write_if_changed(dfolder / "tracks.xml", tracks_xml)
+				_write_if_changed(dfolder / "theme.xml", build_theme_xml(d, defnames))
+
+				# Icon if provided (iconPath is required in XML either way)
+				if (d.icon_rel or "").strip() and d.icon_src and Path(d.icon_src).exists():
+					target_png = textures_root / (d.icon_rel + ".png")
+					target_png.parent.mkdir(parents=True, exist_ok=True)
+					copy_pairs.append((Path(d.icon_src), target_png))
+
+				# Audio
+				dest_folder = sounds_root / d.content_folder
+				dest_folder.mkdir(parents=True, exist_ok=True)
+				for t in d.tracks:
+					copy_pairs.append((t.path, dest_folder / f"{t.idx:03d}. {t.file_title}.ogg"))
+
+			total = len(copy_pairs)
+			q.put(("progress", 0, total))
+			def _copy_one(pair):
+				src, dst = pair
+				if _same_file(src, dst): return  # unchanged since last build
+				try:
+					# propagate mtime so _same_file can hit on the next run
+					_fast_copy(src, dst)
+					st = os.stat(src)
+					os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+				except OSError:
+					try: shutil.copy2(src, dst)
+					except Exception as e: errors.append(f"{Path(src).name}: {e}")
+				except Exception as e: errors.append(f"{Path(src).name}: {e}")
+			done = 0
+			workers = min(16, (os.cpu_count() or 4) * 4)
+			with ThreadPoolExecutor(max_workers=workers) as ex:
+				for _ in ex.map(_copy_one, copy_pairs):
+					done += 1
+					q.put(("progress", done, total))
+		except Exception as e:
+			errors.append(str(e))
+		q.put(("done", mod_dir, errors))
+
+	def _set_build_buttons(self, enabled: bool):
+		state = "normal" if enabled else "disabled"
+		for b in (self.btn_build, self.btn_overwr):
+			try: b.configure(state=state)
+			except Exception: pass
+
+	def _set_build_progress(self, done, total):
+		self.build_progress.configure(maximum=max(1, total), value=done)
+
+	def _build_done(self, mod_dir: Path, errors):
+		self._build_running = False
+		self.build_progress.pack_forget()
+		self._set_build_buttons(True)
+		self._update_toolbar_states()
+		if errors:
+			messagebox.showwarning(APP_TITLE, "Build finished with errors:\n- " + "\n- ".join(errors[:20]))
 		messagebox.showinfo(APP_TITLE, f"Build complete.\n\n{mod_dir}")
 		self._open_folder(mod_dir)
 
 	def _overwrite(self):
+		if self._build_running: return
 		if not self.loaded_mod_dir:
 			messagebox.showerror(APP_TITLE, "Import a MEF mod first (📥 Import)."); return
 		if not self._preflight_ok(True): return
@@ -1270,13 +1793,16 @@ class App(tk.Tk):
 			"(Audio files and About.xml are NOT changed.)"):
 			return
 
+		written = 0
 		for d in self.defs:
 			target = d._src_def_dir if d._src_def_dir else (defs_dir / (sanitize_simple(d.label_game) or d.content_folder or "Game"))
 			target.mkdir(parents=True, exist_ok=True)
-			(target / "tracks.xml").write_text(build_tracks_xml(d), encoding="utf-8", newline="\n")
-			(target / "theme.xml").write_text(build_theme_xml(d), encoding="utf-8", newline="\n")
+			tracks_xml, defnames = build_tracks_xml(d)
+			written += _write_if_changed(target / "tracks.xml", tracks_xml)
+			written += _write_if_changed(target / "theme.xml", build_theme_xml(d, defnames))
+			_DEF_CACHE.pop(str(target), None)  # force a re-parse on next import
 
-		messagebox.showinfo(APP_TITLE, f"Overwrite complete.\n\n{self.loaded_mod_dir}")
+		messagebox.showinfo(APP_TITLE, f"Overwrite complete — {written} file(s) updated.\n\n{self.loaded_mod_dir}")
 		self._open_folder(self.loaded_mod_dir)
 
 	def _update_toolbar_states(self):